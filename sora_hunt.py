@@ -2,19 +2,28 @@
 
 from __future__ import annotations
 
+import functools
+import gzip
+import hashlib
 import html
 import logging
 import os
+import queue
 import re
+import string
 import threading
 import time
-from collections import deque
-from dataclasses import dataclass, field, asdict
-from datetime import datetime, timezone
-from typing import Callable, Dict, List, Optional
-
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, NamedTuple, Optional
+
+import orjson
 import requests
-from flask import Flask, jsonify, render_template_string
+from flask import Flask, Response, jsonify, render_template_string, request
+from markupsafe import escape
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
@@ -30,9 +39,18 @@ DEFAULT_POLL_INTERVAL = 60
 DEFAULT_MAX_POSTS = 75
 DEFAULT_FAILURE_THRESHOLD = 4
 DEFAULT_COOLDOWN_SECONDS = 600
+MIN_POLL_GAP_SECONDS = 5
 MAX_LOG_ENTRIES = 500
 MAX_CANDIDATES = 1000
+MAX_SEEN_CODES = 50000
+# Per listing; must stay above the largest MAX_POSTS (100) so posts still in a
+# listing are never forgotten and rescanned.
+MAX_REDDIT_SCANNED_POSTS = 500
 REQUEST_TIMEOUT = 30
+MAX_FETCH_WORKERS = 8
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 32
+SNAPSHOT_GZIP_LEVEL = 6
 
 # Baseline headers that mimic a modern browser. Individual fetchers can
 # override or extend these values, but ensuring every outbound request has a
@@ -61,10 +79,18 @@ OPENAI_FORUM_LATEST_URL = "https://community.openai.com/latest.json"
 BLUESKY_SEARCH_URL = "https://public.api.bsky.app/xrpc/app.bsky.feed.searchPosts"
 X_PROXY_PREFIX = "https://r.jina.ai/"
 MASTODON_SEARCH_URL = "https://mastodon.social/api/v2/search"
+X_PROXY_MAX_CHARS = 15000
 
-# Enhanced token pattern - supports various formats
+# Enhanced token pattern - supports various formats. Matching is
+# case-insensitive so callers only uppercase the matches, not the whole text.
+# The lookaheads require at least one digit and one letter, so ordinary words
+# and plain numbers never leave the regex engine. re.ASCII keeps the classes to
+# plain ASCII; under Unicode case folding [A-Z] also matches characters such as
+# the long s and the Kelvin sign.
 
-TOKEN_PATTERN = re.compile(r"\b[A-Z0-9]{6}\b")
+TOKEN_PATTERN = re.compile(
+    r"\b(?=[A-Z]*[0-9])(?=[0-9]*[A-Z])[A-Z0-9]{6}\b", re.IGNORECASE | re.ASCII
+)
 
 INVITE_KEYWORDS = [
     "invite",
@@ -85,6 +111,14 @@ INVITE_KEYWORDS = [
 
 HARD_EXCLUDE = {"HTTP", "HTTPS", "JSON", "XML", "HTML", "STATUS", "ERROR", "STACK"}
 CONTEXT_BAD = {"error", "exception", "stack", "debug", "traceback", "csrf", "403", "404"}
+CONTEXT_STALE = ("expired", "redeemed", "invalid", "used up")
+
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Tokens are plain ASCII, so case-insensitive lookups only need an ASCII fold.
+# Unlike str.lower(), this never changes the string length, so offsets found
+# in the folded text are valid in the original.
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
 
 app = Flask(__name__)
 logging.basicConfig(
@@ -95,7 +129,7 @@ logger = logging.getLogger(__name__)
 
 
 def _build_requests_session() -> requests.Session:
-    """Create a shared HTTP session with retry/backoff behaviour."""
+    """Create a shared HTTP session with pooling and retry/backoff behaviour."""
 
     retry_strategy = Retry(
         total=2,
@@ -106,8 +140,15 @@ def _build_requests_session() -> requests.Session:
         allowed_methods=["GET", "HEAD", "OPTIONS"],
         raise_on_status=False,
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    # Keep enough pooled connections per host for every concurrent fetch so
+    # keep-alive sockets are reused across sources and poll cycles.
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry_strategy,
+    )
     session = requests.Session()
+    session.headers.update(BASE_REQUEST_HEADERS)
     session.mount("https://", adapter)
     session.mount("http://", adapter)
     return session
@@ -115,8 +156,6 @@ def _build_requests_session() -> requests.Session:
 
 _REQUEST_SESSION = _build_requests_session()
 
-ConfigDict = Dict[str, object]
-
 
 @dataclass
 class Candidate:
@@ -131,22 +170,80 @@ class Candidate:
     source_type: str = "unknown"
 
 
-@dataclass
+class PublishedSnapshot(NamedTuple):
+    """Pre-serialized /codes.json body and its cache validators."""
+
+    etag: str
+    last_modified: datetime
+    # Earliest If-Modified-Since that proves a client holds this snapshot.
+    not_modified_since: datetime
+    body: bytes
+    body_gzip: bytes
+
+
+class LogEntry(NamedTuple):
+    """A single activity log event."""
+
+    timestamp: str
+    level: str
+    message: str
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Runtime configuration read from environment variables."""
+
+    poll_interval: int
+    max_posts: int
+    query: str
+    user_agent: str
+    disabled_sources: tuple[str, ...] = ()
+
+
+@dataclass(slots=True)
 class AppState:
-    """Thread-safe application state."""
+    """Thread-safe application state.
+
+    ``lock`` guards the candidates deque and worker thread and ``stats_lock``
+    the poll counters and ``version``. Log events are written from every
+    thread, so they are pushed onto ``log_queue`` without locking and moved
+    into ``activity_log`` by the snapshot builder, the only code that touches
+    the deque (under ``_PUBLISH_LOCK``). ``seen_codes`` is only written by the poller
+    thread and needs no lock; it remembers the ``MAX_SEEN_CODES`` most
+    recently seen codes in LRU order, while ``unique_codes`` counts every code
+    added as a candidate. A code evicted from that cache and found again is
+    counted again, so past ``MAX_SEEN_CODES`` distinct codes the count may
+    exceed the true number of unique codes.
+    """
 
     lock: threading.Lock = field(default_factory=threading.Lock)
-    candidates: deque[Candidate] = field(default_factory=lambda: deque(maxlen=MAX_CANDIDATES))
-    seen_codes: set[str] = field(default_factory=set)
+    # Candidates are stored in their JSON form (see _candidate_to_dict) so
+    # publishing a snapshot does not convert every candidate again. Both
+    # deques are kept newest-first, the order /codes.json serves them in.
+    candidates: deque[Dict[str, object]] = field(default_factory=lambda: deque(maxlen=MAX_CANDIDATES))
+    seen_codes: OrderedDict[str, None] = field(default_factory=OrderedDict)
+    unique_codes: int = 0
+    log_queue: queue.SimpleQueue[LogEntry] = field(default_factory=queue.SimpleQueue)
+    activity_log: deque[LogEntry] = field(default_factory=lambda: deque(maxlen=MAX_LOG_ENTRIES))
+    stats_lock: threading.Lock = field(default_factory=threading.Lock)
     last_poll: Optional[str] = None
-    activity_log: deque[Dict[str, str]] = field(default_factory=lambda: deque(maxlen=MAX_LOG_ENTRIES))
     error_count: int = 0
     success_count: int = 0
+    # Bumped whenever anything reported by /codes.json changes; used as ETag.
+    version: int = 0
+    snapshot: Optional[PublishedSnapshot] = None
     worker_thread: Optional[threading.Thread] = None
 
 
 state = AppState()
 
+# Distinguishes state versions across restarts so a client's cached ETag
+# never matches a fresh process that happens to reach the same version.
+_STATE_EPOCH = os.urandom(4).hex()
+# Last-Modified dates the same way: an If-Modified-Since from before (or in
+# the same second as) this process started may describe another process's data.
+_STATE_STARTED = datetime.now(timezone.utc).replace(microsecond=0)
+
 
 class SourceSpec:
     """Definition for a single external source to poll."""
@@ -154,10 +251,11 @@ class SourceSpec:
     def __init__(
         self,
         name: str,
-        fetcher: Callable[[ConfigDict], List[Dict[str, str]]],
+        fetcher: Callable[[Config], List[Dict[str, str]]],
         *,
         enabled: bool = True,
         rate_limit_delay: float = 0.0,
+        rate_limit_group: Optional[str] = None,
         failure_threshold: int | None = None,
         cooldown_seconds: int | None = None,
     ) -> None:
@@ -165,6 +263,7 @@ class SourceSpec:
         self.fetcher = fetcher
         self.enabled = enabled
         self.rate_limit_delay = rate_limit_delay
+        self.rate_limit_group = rate_limit_group
         self.last_error: Optional[str] = None
         self.last_success: Optional[str] = None
         self.failure_threshold: int = failure_threshold or DEFAULT_FAILURE_THRESHOLD
@@ -174,10 +273,24 @@ class SourceSpec:
         self.disabled_reason: Optional[str] = None
 
 
+_ISO_NOW_CACHE: tuple[float, str] = (float("-inf"), "")
+
+
 def _iso_now() -> str:
-    """Return current UTC time in ISO format."""
+    """Return current UTC time in ISO format.
 
-    return datetime.now(timezone.utc).isoformat()
+    The formatted string is reused for up to a second so bursts of log events
+    and candidates do not each build and format a new datetime.
+    """
+
+    global _ISO_NOW_CACHE
+    now = time.monotonic()
+    cached_at, value = _ISO_NOW_CACHE
+    if now - cached_at < 1.0:
+        return value
+    value = datetime.now(timezone.utc).isoformat()
+    _ISO_NOW_CACHE = (now, value)
+    return value
 
 
 def _iso_from_timestamp(timestamp: Optional[float]) -> Optional[str]:
@@ -191,9 +304,15 @@ def _iso_from_timestamp(timestamp: Optional[float]) -> Optional[str]:
 def _log_event(message: str, level: str = "info") -> None:
     """Store activity log message with timestamp."""
 
-    entry = {"timestamp": _iso_now(), "level": level, "message": message}
-    with state.lock:
-        state.activity_log.append(entry)
+    state.log_queue.put(LogEntry(_iso_now(), level, message))
+    _mark_state_changed()
+
+
+def _mark_state_changed() -> None:
+    """Bump the state version served as the /codes.json ETag."""
+
+    with state.stats_lock:
+        state.version += 1
 
 
 def _read_int_env(name: str, default: int) -> int:
@@ -226,8 +345,13 @@ def _parse_disabled_sources() -> tuple[str, ...]:
     return tuple(sorted(items))
 
 
-def _get_config() -> Dict[str, str | int | tuple[str, ...]]:
-    """Read configuration from environment variables."""
+@functools.lru_cache(maxsize=1)
+def _get_config() -> Config:
+    """Read configuration from environment variables.
+
+    The environment does not change while the process runs, so the result is
+    computed once and shared by the poller and every request.
+    """
 
     poll_interval = _read_int_env("POLL_INTERVAL_SECONDS", DEFAULT_POLL_INTERVAL)
     max_posts = _read_int_env("MAX_POSTS", DEFAULT_MAX_POSTS)
@@ -235,120 +359,222 @@ def _get_config() -> Dict[str, str | int | tuple[str, ...]]:
     user_agent = os.getenv("USER_AGENT", DEFAULT_USER_AGENT)
     disabled_sources = _parse_disabled_sources()
 
-    return {
-        "poll_interval": max(10, poll_interval),
-        "max_posts": max(1, min(max_posts, 100)),
-        "query": query,
-        "user_agent": user_agent,
-        "disabled_sources": disabled_sources,
-    }
+    return Config(
+        poll_interval=max(10, poll_interval),
+        max_posts=max(1, min(max_posts, 100)),
+        query=query,
+        user_agent=user_agent,
+        disabled_sources=disabled_sources,
+    )
 
 
-def _reddit_headers(user_agent: str) -> Dict[str, str]:
+# The header helpers are cached and return read-only mappings, so every fetch
+# shares one headers object per user agent instead of building a new dict.
+
+
+@functools.lru_cache(maxsize=4)
+def _reddit_headers(user_agent: str) -> Mapping[str, str]:
     """Generate Reddit-compatible headers."""
 
-    return {
-        "User-Agent": user_agent,
-        "Accept": "application/json, text/javascript, */*; q=0.01",
-        "Referer": "https://www.reddit.com/",
-    }
+    return MappingProxyType(
+        {
+            "User-Agent": user_agent,
+            "Accept": "application/json, text/javascript, */*; q=0.01",
+            "Referer": "https://www.reddit.com/",
+        }
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _user_agent_headers(user_agent: str) -> Mapping[str, str]:
+    """Generate headers that only override the User-Agent."""
+
+    return MappingProxyType({"User-Agent": user_agent})
 
 
 def _make_request(
     url: str,
-    headers: Dict[str, str],
+    headers: Mapping[str, str],
     params: Optional[Dict[str, str | int]] = None,
     *,
     timeout: int = REQUEST_TIMEOUT,
+    stream: bool = False,
 ) -> requests.Response:
     """Make HTTP request with retry logic."""
 
-    merged_headers = {**BASE_REQUEST_HEADERS, **(headers or {})}
-    # Update the referer to match the destination when it has not been
-    # explicitly overridden by the caller. Some providers (notably GitHub and
-    # Reddit) prefer to see the request target referenced in the header.
-    merged_headers.setdefault("Referer", url)
-
+    # The session already carries BASE_REQUEST_HEADERS; requests merges the
+    # per-call headers over them.
+    response = _REQUEST_SESSION.get(
+        url,
+        params=params,
+        headers=headers,
+        timeout=timeout,
+        stream=stream,
+    )
     try:
-        response = _REQUEST_SESSION.get(
-            url,
-            params=params,
-            headers=merged_headers,
-            timeout=timeout,
-        )
         response.raise_for_status()
-        return response
-    except requests.exceptions.RequestException:
-        # Let the caller handle logging/context; we only bubble up the error.
+    except requests.HTTPError:
+        response.close()
         raise
+    return response
+
+
+def _decode_json(response: requests.Response) -> dict:
+    """Decode a JSON response body with orjson."""
+
+    return orjson.loads(response.content)
 
 
-def _fetch_reddit(query: str, config: ConfigDict, *, time_filter: str) -> List[Dict[str, str]]:
+# Validators and decoded payloads from the last successful response per
+# (url, params), used to revalidate with conditional GETs.
+_CONDITIONAL_CACHE: Dict[tuple, tuple[Optional[str], Optional[str], dict]] = {}
+_CONDITIONAL_CACHE_LOCK = threading.Lock()
+
+
+def _get_json(
+    url: str,
+    headers: Mapping[str, str],
+    params: Optional[Dict[str, str | int]] = None,
+) -> dict:
+    """Fetch a JSON document, revalidating with ETag/Last-Modified when possible.
+
+    A ``304 Not Modified`` reply returns the previously decoded payload without
+    downloading or parsing the body again.
+    """
+
+    key = (url, tuple(sorted((params or {}).items())))
+    with _CONDITIONAL_CACHE_LOCK:
+        cached = _CONDITIONAL_CACHE.get(key)
+
+    request_headers = dict(headers)
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            request_headers["If-None-Match"] = etag
+        if last_modified:
+            request_headers["If-Modified-Since"] = last_modified
+
+    response = _make_request(url, request_headers, params)
+    if response.status_code == 304 and cached:
+        return cached[2]
+
+    payload = _decode_json(response)
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        with _CONDITIONAL_CACHE_LOCK:
+            _CONDITIONAL_CACHE[key] = (etag, last_modified, payload)
+    return payload
+
+
+def _reddit_item(data: Dict[str, object]) -> Dict[str, str]:
+    """Convert a Reddit post's ``data`` object into an entry."""
+
+    get = data.get
+    permalink = get("permalink") or ""
+    return {
+        "title": get("title", ""),
+        "body": get("selftext", "") or "",
+        "url": f"https://www.reddit.com{permalink}" if permalink else get("url", ""),
+    }
+
+
+# Posts already scanned per Reddit listing, keyed like the conditional-GET
+# cache, oldest first. No lock: two sources sharing a listing can at worst
+# race into scanning a few posts twice, and codes are deduplicated anyway.
+_REDDIT_SCANNED: Dict[tuple, OrderedDict[tuple, None]] = {}
+
+
+def _fetch_reddit_listing(
+    url: str, params: Dict[str, str | int], config: Config
+) -> List[Dict[str, str]]:
+    """Fetch a Reddit listing (search or subreddit) and convert its new posts.
+
+    Listings mostly repeat the previous poll, so posts this listing already
+    returned are skipped instead of being scanned again. Posts are tracked by
+    fullname rather than by time, so ones that show up late with an old
+    ``created_utc`` (released from the spam filter or mod queue, or indexed
+    late by search) are still scanned; an edit changes the ``edited`` stamp
+    and gets the post rescanned too.
+    """
+
+    payload = _get_json(url, _reddit_headers(config.user_agent), params)
+    items = payload.get("data", {}).get("children", [])
+
+    key = (url, tuple(sorted(params.items())))
+    scanned = _REDDIT_SCANNED.get(key)
+    if scanned is None:
+        scanned = _REDDIT_SCANNED[key] = OrderedDict()
+    entries: List[Dict[str, str]] = []
+    for item in items:
+        data = item.get("data", {})
+        name = data.get("name")
+        if not name:
+            entries.append(_reddit_item(data))
+            continue
+        post_key = (name, data.get("edited"))
+        if post_key in scanned:
+            # Still in the listing, so keep remembering it.
+            scanned.move_to_end(post_key)
+            continue
+        scanned[post_key] = None
+        entries.append(_reddit_item(data))
+    while len(scanned) > MAX_REDDIT_SCANNED_POSTS:
+        scanned.popitem(last=False)
+
+    return entries
+
+
+def _fetch_reddit(query: str, config: Config, *, time_filter: str) -> List[Dict[str, str]]:
     """Fetch Reddit posts for a given query and time filter."""
 
     params = {
         "q": query,
         "sort": "new",
-        "limit": config["max_posts"],
+        "limit": config.max_posts,
         "restrict_sr": False,
         "t": time_filter,
     }
-    headers = _reddit_headers(config["user_agent"])
-    response = _make_request(REDDIT_SEARCH_URL, headers, params)
-    payload = response.json()
-    items = payload.get("data", {}).get("children", [])
-
-    results: List[Dict[str, str]] = []
-    for item in items:
-        data = item.get("data", {})
-        title = data.get("title", "")
-        body = data.get("selftext", "") or ""
-        permalink = data.get("permalink") or ""
-        url = f"https://www.reddit.com{permalink}" if permalink else data.get("url", "")
-        results.append({"title": title, "body": body, "url": url})
-    return results
+    return _fetch_reddit_listing(REDDIT_SEARCH_URL, params, config)
 
 
-def _fetch_reddit_search(config: ConfigDict) -> List[Dict[str, str]]:
+def _fetch_reddit_search(config: Config) -> List[Dict[str, str]]:
     """Fetch Reddit posts using the configured search query."""
 
-    return _fetch_reddit(str(config["query"]), config, time_filter="day")
+    return _fetch_reddit(config.query, config, time_filter="day")
 
 
-def _fetch_reddit_search_for(query: str, config: ConfigDict) -> List[Dict[str, str]]:
+def _fetch_reddit_search_for(query: str, config: Config) -> List[Dict[str, str]]:
     """Fetch Reddit posts for a specific query."""
 
     return _fetch_reddit(query, config, time_filter="week")
 
 
-def _fetch_reddit_subreddit(subreddit: str, config: ConfigDict) -> List[Dict[str, str]]:
+def _fetch_reddit_subreddit(subreddit: str, config: Config) -> List[Dict[str, str]]:
     """Fetch newest posts from a specific subreddit."""
 
-    params = {"limit": config["max_posts"]}
-    headers = _reddit_headers(config["user_agent"])
+    params = {"limit": config.max_posts}
     url = REDDIT_SUBREDDIT_URL_TEMPLATE.format(subreddit=subreddit)
-    response = _make_request(url, headers, params)
-    payload = response.json()
-    items = payload.get("data", {}).get("children", [])
-
-    results: List[Dict[str, str]] = []
-    for item in items:
-        data = item.get("data", {})
-        title = data.get("title", "")
-        body = data.get("selftext", "") or ""
-        permalink = data.get("permalink") or ""
-        url = f"https://www.reddit.com{permalink}" if permalink else data.get("url", "")
-        results.append({"title": title, "body": body, "url": url})
-    return results
+    return _fetch_reddit_listing(url, params, config)
 
 
-def _fetch_x_search(search_url: str, description: str, config: ConfigDict) -> List[Dict[str, str]]:
+def _fetch_x_search(search_url: str, description: str, config: Config) -> List[Dict[str, str]]:
     """Fetch X/Twitter search results through proxy."""
 
     proxied_url = f"{X_PROXY_PREFIX}{search_url}"
-    headers = {"User-Agent": config["user_agent"]}
-    response = _make_request(proxied_url, headers)
-    text_content = response.text[:15000]
+    headers = _user_agent_headers(config.user_agent)
+    # Proxied pages can be far larger than the part we scan, so stream the
+    # body and stop reading once enough text has been decoded.
+    parts: List[str] = []
+    length = 0
+    with _make_request(proxied_url, headers, stream=True) as response:
+        response.encoding = response.encoding or "utf-8"
+        for chunk in response.iter_content(chunk_size=4096, decode_unicode=True):
+            parts.append(chunk)
+            length += len(chunk)
+            if length >= X_PROXY_MAX_CHARS:
+                break
+    text_content = "".join(parts)[:X_PROXY_MAX_CHARS]
 
     return [
         {
@@ -359,18 +585,17 @@ def _fetch_x_search(search_url: str, description: str, config: ConfigDict) -> Li
     ]
 
 
-def _fetch_bluesky_search(config: ConfigDict) -> List[Dict[str, str]]:
+def _fetch_bluesky_search(config: Config) -> List[Dict[str, str]]:
     """Fetch Bluesky posts mentioning Sora invites."""
 
     params = {
         "q": "Sora invite code",
-        "limit": min(int(config["max_posts"]), 25),
+        "limit": min(config.max_posts, 25),
     }
-    headers = {"User-Agent": config["user_agent"]}
+    headers = _user_agent_headers(config.user_agent)
 
     try:
-        response = _make_request(BLUESKY_SEARCH_URL, headers, params)
-        payload = response.json()
+        payload = _get_json(BLUESKY_SEARCH_URL, headers, params)
         posts = payload.get("posts", [])
 
         results: List[Dict[str, str]] = []
@@ -396,25 +621,26 @@ def _fetch_bluesky_search(config: ConfigDict) -> List[Dict[str, str]]:
         return []
 
 
-def _fetch_mastodon_search(config: ConfigDict) -> List[Dict[str, str]]:
+def _fetch_mastodon_search(config: Config) -> List[Dict[str, str]]:
     """Search Mastodon for Sora invite mentions."""
 
     params = {
         "q": "Sora invite",
         "type": "statuses",
-        "limit": min(int(config["max_posts"]), 20),
+        "limit": min(config.max_posts, 20),
     }
-    headers = {"User-Agent": config["user_agent"]}
+    headers = _user_agent_headers(config.user_agent)
 
     try:
-        response = _make_request(MASTODON_SEARCH_URL, headers, params)
-        payload = response.json()
+        payload = _get_json(MASTODON_SEARCH_URL, headers, params)
         statuses = payload.get("statuses", [])
 
         results: List[Dict[str, str]] = []
         for status in statuses:
             content = status.get("content", "")
-            clean_content = re.sub(r"<[^>]+>", "", content)
+            # Replace tags with a space so text from adjacent elements does not
+            # merge into one word, then decode entities such as &amp;.
+            clean_content = html.unescape(_HTML_TAG_RE.sub(" ", content))
             account = status.get("account", {}).get("acct", "unknown")
             url = status.get("url", "")
 
@@ -431,16 +657,15 @@ def _fetch_mastodon_search(config: ConfigDict) -> List[Dict[str, str]]:
         return []
 
 
-def _fetch_hacker_news(config: ConfigDict) -> List[Dict[str, str]]:
+def _fetch_hacker_news(config: Config) -> List[Dict[str, str]]:
     """Fetch recent Hacker News stories."""
 
     params = {
-        "query": config["query"],
+        "query": config.query,
         "tags": "story,comment",
-        "hitsPerPage": min(int(config["max_posts"]), 50),
+        "hitsPerPage": min(config.max_posts, 50),
     }
-    response = _make_request(HN_SEARCH_URL, {}, params)
-    payload = response.json()
+    payload = _get_json(HN_SEARCH_URL, {}, params)
     hits = payload.get("hits", [])
 
     results: List[Dict[str, str]] = []
@@ -454,16 +679,15 @@ def _fetch_hacker_news(config: ConfigDict) -> List[Dict[str, str]]:
     return results
 
 
-def _fetch_openai_forum(config: ConfigDict) -> List[Dict[str, str]]:
+def _fetch_openai_forum(config: Config) -> List[Dict[str, str]]:
     """Fetch latest OpenAI community forum topics."""
 
-    headers = {"User-Agent": config["user_agent"]}
-    response = _make_request(OPENAI_FORUM_LATEST_URL, headers)
-    payload = response.json()
+    headers = _user_agent_headers(config.user_agent)
+    payload = _get_json(OPENAI_FORUM_LATEST_URL, headers)
     topics = payload.get("topic_list", {}).get("topics", [])
 
     results: List[Dict[str, str]] = []
-    for topic in topics[: int(config["max_posts"])]:
+    for topic in topics[: config.max_posts]:
         title = topic.get("title", "")
         excerpt = topic.get("excerpt", "")
         slug = topic.get("slug")
@@ -479,52 +703,77 @@ SOURCES: List[SourceSpec] = [
     SourceSpec("Reddit search (configured)", _fetch_reddit_search),
     SourceSpec(
         "Reddit search (Sora invite code)",
-        lambda config: _fetch_reddit_search_for("Sora invite code", config),
+        functools.partial(_fetch_reddit_search_for, "Sora invite code"),
     ),
     SourceSpec(
         "Reddit search (Sora beta access)",
-        lambda config: _fetch_reddit_search_for('"Sora" "beta" "access"', config),
+        functools.partial(_fetch_reddit_search_for, '"Sora" "beta" "access"'),
     ),
-    SourceSpec("Reddit /r/ChatGPT", lambda config: _fetch_reddit_subreddit("ChatGPT", config)),
-    SourceSpec("Reddit /r/OpenAI", lambda config: _fetch_reddit_subreddit("OpenAI", config)),
-    SourceSpec("Reddit /r/SoraAI", lambda config: _fetch_reddit_subreddit("SoraAI", config)),
-    SourceSpec("Reddit /r/artificial", lambda config: _fetch_reddit_subreddit("artificial", config)),
+    SourceSpec("Reddit /r/ChatGPT", functools.partial(_fetch_reddit_subreddit, "ChatGPT")),
+    SourceSpec("Reddit /r/OpenAI", functools.partial(_fetch_reddit_subreddit, "OpenAI")),
+    SourceSpec("Reddit /r/SoraAI", functools.partial(_fetch_reddit_subreddit, "SoraAI")),
+    SourceSpec("Reddit /r/artificial", functools.partial(_fetch_reddit_subreddit, "artificial")),
     SourceSpec(
         "X live (Sora invite code)",
-        lambda config: _fetch_x_search(
+        functools.partial(
+            _fetch_x_search,
             "https://x.com/search?q=Sora%20invite%20code&f=live",
             "Live tweets: Sora invite code",
-            config,
         ),
         rate_limit_delay=1.0,
+        rate_limit_group="x-proxy",
     ),
     SourceSpec(
         "X live (#SoraInvite)",
-        lambda config: _fetch_x_search(
+        functools.partial(
+            _fetch_x_search,
             "https://x.com/search?q=%23SoraInvite&f=live",
             "Live tweets: #SoraInvite",
-            config,
         ),
         rate_limit_delay=1.0,
+        rate_limit_group="x-proxy",
     ),
     SourceSpec(
         "X live (#SoraAccess)",
-        lambda config: _fetch_x_search(
+        functools.partial(
+            _fetch_x_search,
             "https://x.com/search?q=%23SoraAccess&f=live",
             "Live tweets: #SoraAccess",
-            config,
         ),
         rate_limit_delay=1.0,
+        rate_limit_group="x-proxy",
+    ),
+    SourceSpec(
+        "Bluesky search",
+        _fetch_bluesky_search,
+        rate_limit_delay=2.0,
+        rate_limit_group="bluesky",
+    ),
+    SourceSpec(
+        "Mastodon search",
+        _fetch_mastodon_search,
+        rate_limit_delay=2.0,
+        rate_limit_group="mastodon",
     ),
-    SourceSpec("Bluesky search", _fetch_bluesky_search, rate_limit_delay=2.0),
-    SourceSpec("Mastodon search", _fetch_mastodon_search, rate_limit_delay=2.0),
     SourceSpec("Hacker News", _fetch_hacker_news),
     SourceSpec("OpenAI Community", _fetch_openai_forum),
 ]
 
+# Sources sharing a rate-limit group hit the same host, so they are fetched one
+# at a time with ``rate_limit_delay`` between requests. Everything else is
+# fetched concurrently.
+_RATE_LIMIT_LOCKS: Dict[str, threading.Lock] = {
+    source.rate_limit_group: threading.Lock() for source in SOURCES if source.rate_limit_group
+}
+_RATE_LIMIT_LAST_REQUEST: Dict[str, float] = {group: 0.0 for group in _RATE_LIMIT_LOCKS}
+
 
-def _calculate_confidence(text: str, token: str) -> float:
-    """Calculate confidence score based on context."""
+def _calculate_confidence(text: str) -> float:
+    """Calculate confidence score based on context.
+
+    The score only depends on the surrounding text, so callers compute it once
+    per entry and share it between every token found in that entry.
+    """
 
     text_lower = text.lower()
     score = 0.4
@@ -538,7 +787,7 @@ def _calculate_confidence(text: str, token: str) -> float:
     if any(word in text_lower for word in CONTEXT_BAD):
         score -= 0.35
 
-    if any(word in text_lower for word in ["expired", "redeemed", "invalid", "used up"]):
+    if any(word in text_lower for word in CONTEXT_STALE):
         score -= 0.25
 
     if "```" in text or "<code>" in text:
@@ -547,113 +796,309 @@ def _calculate_confidence(text: str, token: str) -> float:
     return max(0.05, min(score, 1.0))
 
 
-def _extract_tokens(text: str) -> List[str]:
-    """Extract candidate tokens from text."""
-
-    uppercase_text = text.upper()
-    tokens: List[str] = []
+def _extract_tokens(text: str) -> Dict[str, int]:
+    """Extract candidate tokens from text.
 
-    for token in TOKEN_PATTERN.findall(uppercase_text):
-        if (
-            any(ch.isdigit() for ch in token)
-            and any(ch.isalpha() for ch in token)
-            and not any(ex in token for ex in HARD_EXCLUDE)
-        ):
-            tokens.append(token.strip("-"))
+    Returns each distinct token, in order of appearance, mapped to the offset
+    of its first occurrence so snippet building does not have to search again.
+    """
 
     seen: set[str] = set()
-    ordered_tokens: List[str] = []
-    for token in tokens:
-        if token not in seen:
-            ordered_tokens.append(token)
-            seen.add(token)
+    tokens: Dict[str, int] = {}
+
+    for match in TOKEN_PATTERN.finditer(text):
+        token = match.group().upper()
+        if token in seen:
+            continue
+        seen.add(token)
+        if not any(ex in token for ex in HARD_EXCLUDE):
+            tokens[token] = match.start()
 
-    return ordered_tokens
+    return tokens
 
 
-def _build_example_snippet(title: str, body: str, token: str) -> str:
-    """Create snippet highlighting the token."""
+def _build_example_snippet(combined: str, token: str, index: Optional[int] = None) -> str:
+    """Create snippet highlighting the token.
 
-    combined = f"{title}\n{body}".strip()
-    if not combined:
-        return html.escape(title or token)
+    ``combined`` is the entry's ``f"{title}\n{body}"`` text, built once per
+    entry and shared by all of its tokens. ``index`` is the token's offset in
+    it when the caller already knows it (see :func:`_extract_tokens`).
+    """
+
+    if combined.isspace():
+        return str(escape(token))
 
-    match = re.search(re.escape(token), combined, re.IGNORECASE)
-    if match:
-        start = max(match.start() - 60, 0)
-        end = min(match.end() + 60, len(combined))
+    needle = token.translate(_ASCII_LOWER)
+    if index is None:
+        index = combined.translate(_ASCII_LOWER).find(needle)
+    if index != -1:
+        start = max(index - 60, 0)
+        end = min(index + len(needle) + 60, len(combined))
     else:
         start = 0
         end = min(len(combined), 200)
 
     snippet = combined[start:end].replace("\n", " ").strip()
-    pattern = re.compile(re.escape(token), re.IGNORECASE)
+    # Escape the whole snippet once, then wrap the matches in place. Tokens are
+    # alphanumeric, so escaping never splits or creates a match.
+    escaped = str(escape(snippet))
+    folded = escaped.translate(_ASCII_LOWER)
 
     highlighted_parts: List[str] = []
     last_end = 0
-    for token_match in pattern.finditer(snippet):
-        highlighted_parts.append(html.escape(snippet[last_end:token_match.start()]))
-        highlighted_parts.append(f"<mark>{html.escape(token_match.group(0))}</mark>")
-        last_end = token_match.end()
-    highlighted_parts.append(html.escape(snippet[last_end:]))
+    index = folded.find(needle)
+    while index != -1:
+        match_end = index + len(needle)
+        highlighted_parts.append(escaped[last_end:index])
+        highlighted_parts.append(f"<mark>{escaped[index:match_end]}</mark>")
+        last_end = match_end
+        index = folded.find(needle, last_end)
+    highlighted_parts.append(escaped[last_end:])
 
     return "".join(highlighted_parts)
 
 
+def _confidence_class(score: float) -> str:
+    """Return the dashboard CSS class for a confidence score."""
+
+    if score >= 0.75:
+        return "confidence-high"
+    if score >= 0.5:
+        return "confidence-medium"
+    return "confidence-low"
+
+
+def _candidate_to_dict(candidate: Candidate) -> Dict[str, object]:
+    """Return the JSON form of a candidate.
+
+    Lists the fields explicitly; ``dataclasses.asdict`` recurses and deep-copies
+    every value, which is far slower for a flat record like this.
+    """
+
+    return {
+        "code": candidate.code,
+        "example_text": candidate.example_text,
+        "source_title": candidate.source_title,
+        "url": candidate.url,
+        "discovered_at": candidate.discovered_at,
+        "confidence_score": candidate.confidence_score,
+        "confidence_pct": f"{candidate.confidence_score:.0%}",
+        "confidence_class": _confidence_class(candidate.confidence_score),
+        "source_type": candidate.source_type,
+    }
+
+
 def _process_entries(entries: List[Dict[str, str]], source_label: str) -> List[Candidate]:
     """Process entries and register new candidates."""
 
     new_candidates: List[Candidate] = []
+    # Shared state is updated once for the whole batch below rather than
+    # taking the locks for every candidate.
+    candidate_dicts: List[Dict[str, object]] = []
+    log_entries: List[LogEntry] = []
+    source_type = source_label.split()[0].lower() if source_label else "unknown"
+    discovered_at = _iso_now()
+    seen_codes = state.seen_codes
+
     for entry in entries:
         title = entry.get("title", "")
         body = entry.get("body", "")
         url = entry.get("url", "")
-        tokens = _extract_tokens(f"{title}\n{body}")
-
-        for token in tokens:
-            with state.lock:
-                if token in state.seen_codes:
-                    continue
-                state.seen_codes.add(token)
-
-            confidence = _calculate_confidence(f"{title}\n{body}", token)
-            snippet = _build_example_snippet(title, body, token)
-            display_title = title or "Untitled"
-            if source_label and source_label not in display_title:
-                display_title = f"[{source_label}] {display_title}"
+        combined = f"{title}\n{body}"
+        tokens = _extract_tokens(combined)
+        confidence: Optional[float] = None
+        display_title: Optional[str] = None
+
+        for token, offset in tokens.items():
+            # Only the poller thread adds codes, and dict membership/insert
+            # are atomic, so the seen-code check needs no lock at all. A hit
+            # refreshes the code, so the least recently seen codes are the
+            # ones forgotten once the cap is reached.
+            if token in seen_codes:
+                seen_codes.move_to_end(token)
+                continue
+            seen_codes[token] = None
+            if len(seen_codes) > MAX_SEEN_CODES:
+                seen_codes.popitem(last=False)
+
+            # Everything except the snippet is per entry, so work it out once
+            # and share it between the entry's tokens.
+            if confidence is None:
+                confidence = _calculate_confidence(combined)
+                display_title = title or "Untitled"
+                if source_label and source_label not in display_title:
+                    display_title = f"[{source_label}] {display_title}"
+            snippet = _build_example_snippet(combined, token, offset)
 
             candidate = Candidate(
                 code=token,
                 example_text=snippet,
                 source_title=display_title,
                 url=url,
-                discovered_at=_iso_now(),
+                discovered_at=discovered_at,
                 confidence_score=confidence,
-                source_type=source_label.split()[0].lower() if source_label else "unknown",
+                source_type=source_type,
             )
 
-            with state.lock:
-                state.candidates.append(candidate)
-
             new_candidates.append(candidate)
-            _log_event(
-                f"New candidate {token} from {source_label or 'unknown source'} (conf={confidence:.2f})",
-                "success",
+            candidate_dicts.append(_candidate_to_dict(candidate))
+            log_entries.append(
+                LogEntry(
+                    discovered_at,
+                    "success",
+                    f"New candidate {token} from {source_label or 'unknown source'} (conf={confidence:.2f})",
+                )
             )
 
+    if candidate_dicts:
+        with state.lock:
+            state.candidates.extendleft(candidate_dicts)
+            state.unique_codes += len(candidate_dicts)
+        for entry in log_entries:
+            state.log_queue.put(entry)
+        _mark_state_changed()
+
     return new_candidates
 
 
+# Serializes publishers so an older snapshot never replaces a newer one.
+_PUBLISH_LOCK = threading.Lock()
+
+
+def _publish_snapshot() -> PublishedSnapshot:
+    """Serialize the state served by /codes.json and publish it.
+
+    The poller calls this whenever it has updated the state, so requests only
+    read ``state.snapshot`` instead of locking and serializing on every hit.
+    The attribute is replaced in a single assignment, so readers always see a
+    matching ETag and body without taking a lock.
+    """
+
+    with _PUBLISH_LOCK:
+        return _build_and_store_snapshot()
+
+
+def _build_and_store_snapshot() -> PublishedSnapshot:
+    """Build the /codes.json snapshot; callers hold ``_PUBLISH_LOCK``.
+
+    Writers change the data first and bump ``version`` afterwards, so the
+    version is read before anything is copied: every change counted in it is
+    then guaranteed to be in the body. Changes whose bump has not happened
+    yet may also be included, so a version that was already published is
+    never rebuilt; its ETag keeps meaning exactly one body, and the pending
+    bump triggers the next build.
+    """
+
+    with state.stats_lock:
+        last_poll = state.last_poll
+        success_count = state.success_count
+        error_count = state.error_count
+        version = state.version
+    etag = f"{_STATE_EPOCH}-{version}"
+    previous = state.snapshot
+    if previous is not None and previous.etag == etag:
+        return previous
+
+    config = _get_config()
+    disabled_set = set(config.disabled_sources)
+    with state.lock:
+        candidates = list(state.candidates)
+        total_candidates = len(state.candidates)
+        unique_codes = state.unique_codes
+    # Move queued log events into the bounded deque. Only this function
+    # touches the deque, so it needs no lock of its own. The drain must stay
+    # after the version read above: an event put before that read is then
+    # always drained into this body, never left for a later body published
+    # under the same ETag.
+    log = state.activity_log
+    while True:
+        try:
+            log.appendleft(state.log_queue.get_nowait())
+        except queue.Empty:
+            break
+    # Serialized as [timestamp, level, message] arrays rather than objects
+    # so the keys are not repeated for every entry.
+    activity_log = [tuple(entry) for entry in log]
+
+    snapshot = {
+        "query": config.query,
+        "poll_interval_seconds": config.poll_interval,
+        "max_posts": config.max_posts,
+        "disabled_sources": list(config.disabled_sources),
+        "last_poll": last_poll,
+        "total_candidates": total_candidates,
+        "unique_codes": unique_codes,
+        "success_count": success_count,
+        "error_count": error_count,
+        "candidates": candidates,
+        "activity_log": activity_log,
+        "sources": [
+            {
+                "name": source.name,
+                "enabled": source.enabled,
+                "active": (
+                    source.enabled
+                    and source.cooldown_until is None
+                    and source.name.lower() not in disabled_set
+                ),
+                "last_success": source.last_success,
+                "last_error": source.last_error,
+                "failure_count": source.failure_count,
+                "failure_threshold": source.failure_threshold,
+                "cooldown_until": _iso_from_timestamp(source.cooldown_until),
+                "disabled_reason": source.disabled_reason,
+                "rate_limit_delay": source.rate_limit_delay,
+            }
+            for source in SOURCES
+        ],
+    }
+    body = orjson.dumps(snapshot)
+    # HTTP dates have one-second resolution, so several snapshots can share
+    # a Last-Modified. A client echoing that date may hold an earlier snapshot
+    # from the same second, so it only proves freshness for the first one.
+    last_modified = datetime.now(timezone.utc).replace(microsecond=0)
+    not_modified_since = last_modified
+    if previous is not None and previous.last_modified >= last_modified:
+        not_modified_since = last_modified + timedelta(seconds=1)
+    published = PublishedSnapshot(
+        etag=etag,
+        last_modified=last_modified,
+        not_modified_since=not_modified_since,
+        body=body,
+        body_gzip=gzip.compress(body, compresslevel=SNAPSHOT_GZIP_LEVEL),
+    )
+    state.snapshot = published
+    return published
+
+
+def _fetch_source(source: SourceSpec, config: Config) -> List[Dict[str, str]]:
+    """Run a source's fetcher, spacing out requests within its rate-limit group."""
+
+    group = source.rate_limit_group
+    if group is None:
+        return source.fetcher(config)
+
+    with _RATE_LIMIT_LOCKS[group]:
+        wait = _RATE_LIMIT_LAST_REQUEST[group] + source.rate_limit_delay - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        try:
+            return source.fetcher(config)
+        finally:
+            _RATE_LIMIT_LAST_REQUEST[group] = time.monotonic()
+
+
 def _poll_sources() -> None:
     """Main polling loop."""
 
+    next_poll_at = time.monotonic()
     while True:
-        start_time = time.time()
         config = _get_config()
-        disabled_set = {name.lower() for name in config.get("disabled_sources", ())}
+        disabled_set = set(config.disabled_sources)
 
         _log_event(f"Starting poll cycle ({len(SOURCES)} sources)", "info")
         cycle_candidates: List[Candidate] = []
+        due_sources: List[SourceSpec] = []
 
         for source in SOURCES:
             if not source.enabled:
@@ -683,48 +1128,62 @@ def _poll_sources() -> None:
                 source.failure_count = 0
                 source.disabled_reason = None
 
-            try:
-                entries = source.fetcher(config)
-                new_from_source = _process_entries(entries, source.name)
-                cycle_candidates.extend(new_from_source)
+            due_sources.append(source)
 
-                source.last_success = _iso_now()
-                source.last_error = None
-                source.failure_count = 0
-                source.disabled_reason = None
-
-                with state.lock:
-                    state.success_count += 1
-
-                _log_event(
-                    f"{source.name}: {len(entries)} item(s), {len(new_from_source)} new",
-                    "debug",
-                )
+        # Fetches are I/O bound, so run them concurrently and handle each
+        # result on this thread as it arrives. Source bookkeeping therefore
+        # stays single-threaded.
+        with ThreadPoolExecutor(
+            max_workers=MAX_FETCH_WORKERS, thread_name_prefix="source-fetch"
+        ) as executor:
+            futures = {
+                executor.submit(_fetch_source, source, config): source for source in due_sources
+            }
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    entries = future.result()
+                    new_from_source = _process_entries(entries, source.name)
+                    cycle_candidates.extend(new_from_source)
+
+                    source.last_success = _iso_now()
+                    source.last_error = None
+                    source.failure_count = 0
+                    source.disabled_reason = None
+
+                    with state.stats_lock:
+                        state.success_count += 1
+                        state.version += 1
 
-                if source.rate_limit_delay > 0:
-                    time.sleep(source.rate_limit_delay)
+                    _log_event(
+                        f"{source.name}: {len(entries)} item(s), {len(new_from_source)} new",
+                        "debug",
+                    )
+                    _publish_snapshot()
 
-            except Exception as exc:  # pragma: no cover - network failures
-                error_msg = f"{source.name}: {exc}"
-                logger.exception("%s", error_msg)
-                _log_event(error_msg, "error")
+                except Exception as exc:  # pragma: no cover - network failures
+                    error_msg = f"{source.name}: {exc}"
+                    logger.exception("%s", error_msg)
+                    _log_event(error_msg, "error")
 
-                source.last_error = _iso_now()
+                    source.last_error = _iso_now()
 
-                with state.lock:
-                    state.error_count += 1
+                    with state.stats_lock:
+                        state.error_count += 1
+                        state.version += 1
 
-                source.failure_count += 1
-                if source.failure_count >= source.failure_threshold:
-                    source.cooldown_until = time.time() + source.cooldown_seconds
-                    source.disabled_reason = "cooldown"
-                    resume_at = _iso_from_timestamp(source.cooldown_until)
-                    _log_event(
-                        f"{source.name} paused for {source.cooldown_seconds}s after repeated failures; will resume at {resume_at}",
-                        "warning",
-                    )
-                else:
-                    source.disabled_reason = "error"
+                    source.failure_count += 1
+                    if source.failure_count >= source.failure_threshold:
+                        source.cooldown_until = time.time() + source.cooldown_seconds
+                        source.disabled_reason = "cooldown"
+                        resume_at = _iso_from_timestamp(source.cooldown_until)
+                        _log_event(
+                            f"{source.name} paused for {source.cooldown_seconds}s after repeated failures; will resume at {resume_at}",
+                            "warning",
+                        )
+                    else:
+                        source.disabled_reason = "error"
+                    _publish_snapshot()
 
         logger.info("Poll completed: %s new candidates", len(cycle_candidates))
 
@@ -733,12 +1192,18 @@ def _poll_sources() -> None:
         else:
             _log_event("No new candidates this cycle", "info")
 
-        with state.lock:
+        with state.stats_lock:
             state.last_poll = _iso_now()
+            state.version += 1
+        _publish_snapshot()
 
-        elapsed = time.time() - start_time
-        sleep_for = max(config["poll_interval"] - elapsed, 5)
-        time.sleep(sleep_for)
+        # Polls start on a fixed schedule measured on the monotonic clock, so
+        # wall-clock adjustments cannot stretch or skip an interval. A poll
+        # that overruns its slot is followed by a short pause rather than
+        # a burst of catch-up polls.
+        now = time.monotonic()
+        next_poll_at = max(next_poll_at + config.poll_interval, now + MIN_POLL_GAP_SECONDS)
+        time.sleep(next_poll_at - now)
 
 
 def _start_background_thread() -> None:
@@ -754,561 +1219,797 @@ def _start_background_thread() -> None:
 
     logger.info("Background polling thread started")
     _log_event("System initialized", "info")
+    _publish_snapshot()
+
+
+DASHBOARD_TEMPLATE = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="utf-8" />
+    <meta name="viewport" content="width=device-width, initial-scale=1.0" />
+    <title>Sora Invite Code Hunter</title>
+    <style>
+        :root {
+            --bg-primary: #f5f5f5;
+            --bg-secondary: #fff;
+            --text-primary: #222;
+            --text-secondary: #555;
+            --border-color: #ccc;
+            --hover-bg: #f0f0f0;
+            --success-color: #064;
+            --error-color: #b00;
+            --info-color: #0a5;
+        }
 
-
-@app.route("/")
-def index() -> str:
-    """Serve the main web interface."""
-
-    html_template = """
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="utf-8" />
-        <meta name="viewport" content="width=device-width, initial-scale=1.0" />
-        <title>Sora Invite Code Hunter</title>
-        <style>
+        @media (prefers-color-scheme: dark) {
             :root {
-                --bg-primary: #f5f5f5;
-                --bg-secondary: #fff;
-                --text-primary: #222;
-                --text-secondary: #555;
-                --border-color: #ccc;
-                --hover-bg: #f0f0f0;
-                --success-color: #064;
-                --error-color: #b00;
-                --info-color: #0a5;
+                --bg-primary: #1a1a1a;
+                --bg-secondary: #2a2a2a;
+                --text-primary: #e0e0e0;
+                --text-secondary: #b0b0b0;
+                --border-color: #444;
+                --hover-bg: #333;
             }
+        }
 
-            @media (prefers-color-scheme: dark) {
-                :root {
-                    --bg-primary: #1a1a1a;
-                    --bg-secondary: #2a2a2a;
-                    --text-primary: #e0e0e0;
-                    --text-secondary: #b0b0b0;
-                    --border-color: #444;
-                    --hover-bg: #333;
-                }
-            }
+        * { box-sizing: border-box; }
 
-            * { box-sizing: border-box; }
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Arial, sans-serif;
+            margin: 0;
+            padding: 2rem;
+            background-color: var(--bg-primary);
+            color: var(--text-primary);
+            line-height: 1.6;
+        }
 
-            body {
-                font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Arial, sans-serif;
-                margin: 0;
-                padding: 2rem;
-                background-color: var(--bg-primary);
-                color: var(--text-primary);
-                line-height: 1.6;
-            }
+        .container { max-width: 1400px; margin: 0 auto; }
 
-            .container { max-width: 1400px; margin: 0 auto; }
+        h1 {
+            color: var(--text-primary);
+            margin-bottom: 0.5rem;
+            font-size: 2rem;
+        }
 
-            h1 {
-                color: var(--text-primary);
-                margin-bottom: 0.5rem;
-                font-size: 2rem;
-            }
+        h2 {
+            margin-top: 2.5rem;
+            font-size: 1.5rem;
+            border-bottom: 2px solid var(--border-color);
+            padding-bottom: 0.5rem;
+        }
 
-            h2 {
-                margin-top: 2.5rem;
-                font-size: 1.5rem;
-                border-bottom: 2px solid var(--border-color);
-                padding-bottom: 0.5rem;
-            }
+        .stats {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 1rem;
+            margin: 1.5rem 0;
+        }
 
-            .stats {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-                gap: 1rem;
-                margin: 1.5rem 0;
-            }
+        .stat-card {
+            background: var(--bg-secondary);
+            padding: 1rem;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
 
-            .stat-card {
-                background: var(--bg-secondary);
-                padding: 1rem;
-                border-radius: 8px;
-                box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            }
+        .stat-label {
+            font-size: 0.85rem;
+            color: var(--text-secondary);
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+        }
 
-            .stat-label {
-                font-size: 0.85rem;
-                color: var(--text-secondary);
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-            }
+        .stat-value {
+            font-size: 1.75rem;
+            font-weight: bold;
+            margin-top: 0.25rem;
+        }
 
-            .stat-value {
-                font-size: 1.75rem;
-                font-weight: bold;
-                margin-top: 0.25rem;
-            }
+        .table-viewport {
+            max-height: 70vh;
+            overflow-y: auto;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+            border-radius: 8px;
+        }
 
-            table {
-                border-collapse: collapse;
-                width: 100%;
-                background: var(--bg-secondary);
-                box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-                border-radius: 8px;
-                overflow: hidden;
-            }
+        table {
+            border-collapse: collapse;
+            width: 100%;
+            background: var(--bg-secondary);
+        }
 
-            th, td {
-                border: 1px solid var(--border-color);
-                padding: 0.75rem;
-                text-align: left;
-                vertical-align: top;
-            }
+        th, td {
+            border: 1px solid var(--border-color);
+            padding: 0.75rem;
+            text-align: left;
+            vertical-align: top;
+        }
 
-            th {
-                background: var(--hover-bg);
-                font-weight: 600;
-                position: sticky;
-                top: 0;
-                z-index: 10;
-            }
+        th {
+            background: var(--hover-bg);
+            font-weight: 600;
+            position: sticky;
+            top: 0;
+            z-index: 10;
+        }
 
-            tbody tr:hover { background: var(--hover-bg); }
+        tbody tr:not(.spacer):hover { background: var(--hover-bg); }
 
-            code {
-                font-size: 1.1rem;
-                font-weight: bold;
-                font-family: "Courier New", Courier, monospace;
-                color: var(--success-color);
-            }
+        /* Candidate rows have a fixed height so the table can be virtualized;
+           keep in sync with CANDIDATE_ROW_HEIGHT in the script below. Every
+           free-text cell wraps its content in .cell-text, which caps it at
+           three lines, so no row can grow past that height. */
+        .candidate-row td {
+            height: 96px;
+            padding: 0.5rem 0.75rem;
+        }
 
-            .confidence {
-                display: inline-block;
-                padding: 0.2rem 0.5rem;
-                border-radius: 4px;
-                font-size: 0.85rem;
-                font-weight: 600;
-            }
+        .cell-text {
+            display: -webkit-box;
+            -webkit-line-clamp: 3;
+            -webkit-box-orient: vertical;
+            max-height: 4.8em;
+            overflow: hidden;
+            overflow-wrap: anywhere;
+        }
 
-            .confidence-high { background: #d4edda; color: #155724; }
-            .confidence-medium { background: #fff3cd; color: #856404; }
-            .confidence-low { background: #f8d7da; color: #721c24; }
+        .spacer td {
+            padding: 0;
+            border: none;
+        }
 
-            .controls {
-                display: flex;
-                gap: 1rem;
-                align-items: center;
-                margin: 1.5rem 0;
-                flex-wrap: wrap;
-            }
+        code {
+            font-size: 1.1rem;
+            font-weight: bold;
+            font-family: "Courier New", Courier, monospace;
+            color: var(--success-color);
+        }
 
-            button {
-                padding: 0.6rem 1.2rem;
-                border: 1px solid var(--border-color);
-                background: var(--bg-secondary);
-                color: var(--text-primary);
-                border-radius: 6px;
-                cursor: pointer;
-                font-size: 1rem;
-                transition: all 0.2s ease;
-            }
+        .confidence {
+            display: inline-block;
+            padding: 0.2rem 0.5rem;
+            border-radius: 4px;
+            font-size: 0.85rem;
+            font-weight: 600;
+        }
 
-            button:hover {
-                background: var(--hover-bg);
-                transform: translateY(-1px);
-            }
+        .confidence-high { background: #d4edda; color: #155724; }
+        .confidence-medium { background: #fff3cd; color: #856404; }
+        .confidence-low { background: #f8d7da; color: #721c24; }
 
-            #status {
-                font-size: 0.9rem;
-                color: var(--text-secondary);
-                padding: 0.5rem;
-            }
+        .controls {
+            display: flex;
+            gap: 1rem;
+            align-items: center;
+            margin: 1.5rem 0;
+            flex-wrap: wrap;
+        }
 
-            #activityLog {
-                list-style: none;
-                padding: 0;
-                max-height: 300px;
-                overflow-y: auto;
-                background: var(--bg-secondary);
-                border: 1px solid var(--border-color);
-                border-radius: 8px;
-            }
+        button {
+            padding: 0.6rem 1.2rem;
+            border: 1px solid var(--border-color);
+            background: var(--bg-secondary);
+            color: var(--text-primary);
+            border-radius: 6px;
+            cursor: pointer;
+            font-size: 1rem;
+            transition: all 0.2s ease;
+        }
 
-            #activityLog li {
-                border-bottom: 1px solid var(--border-color);
-                padding: 0.75rem;
-                font-family: "Courier New", Courier, monospace;
-                font-size: 0.9rem;
-            }
+        button:hover {
+            background: var(--hover-bg);
+            transform: translateY(-1px);
+        }
+
+        #status {
+            font-size: 0.9rem;
+            color: var(--text-secondary);
+            padding: 0.5rem;
+        }
 
-            #activityLog li:last-child { border-bottom: none; }
+        #activityLog {
+            list-style: none;
+            padding: 0;
+            max-height: 300px;
+            overflow-y: auto;
+            background: var(--bg-secondary);
+            border: 1px solid var(--border-color);
+            border-radius: 8px;
+        }
 
-            .log-timestamp {
-                font-weight: bold;
-                margin-right: 0.75rem;
-                color: var(--text-secondary);
-            }
+        #activityLog li {
+            border-bottom: 1px solid var(--border-color);
+            padding: 0.75rem;
+            font-family: "Courier New", Courier, monospace;
+            font-size: 0.9rem;
+        }
+
+        #activityLog li:last-child { border-bottom: none; }
 
-            .log-info { color: var(--info-color); }
-            .log-error { color: var(--error-color); }
-            .log-debug { color: var(--text-secondary); }
-            .log-success { color: var(--success-color); }
+        .log-timestamp {
+            font-weight: bold;
+            margin-right: 0.75rem;
+            color: var(--text-secondary);
+        }
+
+        .log-info { color: var(--info-color); }
+        .log-error { color: var(--error-color); }
+        .log-debug { color: var(--text-secondary); }
+        .log-success { color: var(--success-color); }
+
+        .empty {
+            text-align: center;
+            color: var(--text-secondary);
+            padding: 2rem;
+        }
+
+        .sources {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(220px, 1fr));
+            gap: 1rem;
+        }
+
+        .source-card {
+            background: var(--bg-secondary);
+            border: 1px solid var(--border-color);
+            border-radius: 8px;
+            padding: 0.75rem 1rem;
+        }
+
+        .source-card h3 {
+            margin: 0 0 0.5rem;
+            font-size: 1rem;
+        }
+
+        .source-card p {
+            margin: 0.25rem 0;
+            font-size: 0.85rem;
+            color: var(--text-secondary);
+        }
+
+        .source-card ul {
+            margin: 0.5rem 0 0;
+            padding-left: 1.25rem;
+            color: var(--text-secondary);
+            font-size: 0.8rem;
+        }
+
+        .badge {
+            display: inline-block;
+            padding: 0.2rem 0.5rem;
+            border-radius: 999px;
+            font-size: 0.75rem;
+            font-weight: 600;
+            background: var(--hover-bg);
+            color: var(--text-secondary);
+        }
 
-            .empty {
-                text-align: center;
-                color: var(--text-secondary);
-                padding: 2rem;
+        @media (max-width: 768px) {
+            body { padding: 1rem; }
+            h1 { font-size: 1.5rem; }
+            table, th, td { font-size: 0.85rem; }
+            .controls { flex-direction: column; align-items: stretch; }
+            button { width: 100%; }
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>🎬 Sora Invite Code Hunter</h1>
+        <p>Real-time monitoring of potential Sora invite codes from Reddit, X, Bluesky, Mastodon, Hacker News, and the OpenAI forums.</p>
+
+        <div class="controls">
+            <button id="refreshButton" type="button">🔄 Refresh now</button>
+            <label>
+                <input type="checkbox" id="autoRefresh" checked />
+                Auto refresh every minute
+            </label>
+            <span id="status">Waiting for first update…</span>
+        </div>
+
+        <div class="stats">
+            <div class="stat-card">
+                <div class="stat-label">Total Candidates</div>
+                <div class="stat-value" id="totalCandidates">0</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-label">Codes Discovered</div>
+                <div class="stat-value" id="uniqueCodes">0</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-label">Successful Polls</div>
+                <div class="stat-value" id="successCount">0</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-label">Errors</div>
+                <div class="stat-value" id="errorCount">0</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-label">Active Sources</div>
+                <div class="stat-value" id="activeSources">0</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-label">Paused/Disabled Sources</div>
+                <div class="stat-value" id="pausedSources">0</div>
+            </div>
+        </div>
+
+        <p><strong>Last Poll:</strong> <span id="lastPoll">not yet</span></p>
+        <p><strong>Tracking Query:</strong> <code id="queryDisplay"></code></p>
+        <p><strong>Environment Disabled Sources:</strong> <span id="disabledSourcesLabel">none</span></p>
+
+        <div class="table-viewport" id="candidatesViewport">
+        <table>
+            <thead>
+                <tr>
+                    <th>Code</th>
+                    <th>Confidence</th>
+                    <th>Source</th>
+                    <th>Example Text</th>
+                    <th>Discovered</th>
+                </tr>
+            </thead>
+            <tbody id="candidatesBody">
+                <tr><td colspan="5" class="empty">Loading candidates…</td></tr>
+            </tbody>
+        </table>
+        </div>
+
+        <h2>Source Status</h2>
+        <div id="sources" class="sources"></div>
+
+        <h2>Activity Log</h2>
+        <ul id="activityLog">
+            <li class="empty">Waiting for log entries…</li>
+        </ul>
+    </div>
+    <script>
+        const candidatesBody = document.getElementById('candidatesBody');
+        const candidatesViewport = document.getElementById('candidatesViewport');
+        const lastPollEl = document.getElementById('lastPoll');
+        const statusEl = document.getElementById('status');
+        const logEl = document.getElementById('activityLog');
+        const refreshButton = document.getElementById('refreshButton');
+        const autoRefreshEl = document.getElementById('autoRefresh');
+        const totalCandidatesEl = document.getElementById('totalCandidates');
+        const uniqueCodesEl = document.getElementById('uniqueCodes');
+        const successCountEl = document.getElementById('successCount');
+        const errorCountEl = document.getElementById('errorCount');
+        const activeSourcesEl = document.getElementById('activeSources');
+        const pausedSourcesEl = document.getElementById('pausedSources');
+        const queryDisplayEl = document.getElementById('queryDisplay');
+        const disabledSourcesLabel = document.getElementById('disabledSourcesLabel');
+        const sourcesEl = document.getElementById('sources');
+
+        const CANDIDATE_ROW_HEIGHT = 96;
+        const CANDIDATE_OVERSCAN = 10;
+        const REFRESH_INTERVAL_MS = 60000;
+        const MAX_REFRESH_INTERVAL_MS = 600000;
+
+        let refreshTimer = null;
+        let lastEtag = null;
+        let consecutiveErrors = 0;
+        let inflight = null;
+        let candidateItems = [];
+        let candidateWindowPending = false;
+        // Rows currently in the table, keyed by code, and log items keyed by
+        // their content, so refreshes patch existing nodes instead of
+        // re-parsing the whole list.
+        let candidateRows = new Map();
+        let logItems = new Map();
+        const topSpacer = createSpacerRow();
+        const bottomSpacer = createSpacerRow();
+
+        function setStatus(text, isError = false) {
+            statusEl.textContent = text;
+            statusEl.style.color = isError ? 'var(--error-color)' : 'var(--text-secondary)';
+        }
+
+        function formatDate(value, fallback = '—') {
+            if (!value) {
+                return fallback;
             }
+            const date = new Date(value);
+            if (Number.isNaN(date.getTime())) {
+                return String(value);
+            }
+            return date.toLocaleString();
+        }
 
-            .sources {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(220px, 1fr));
-                gap: 1rem;
+        function createSpacerRow() {
+            const row = document.createElement('tr');
+            row.className = 'spacer';
+            row.insertCell().colSpan = 5;
+            return row;
+        }
+
+        function emptyRow(text) {
+            const row = document.createElement('tr');
+            const cell = row.insertCell();
+            cell.colSpan = 5;
+            cell.className = 'empty';
+            cell.textContent = text;
+            return row;
+        }
+
+        function setText(node, value) {
+            if (node.textContent !== value) {
+                node.textContent = value;
             }
+        }
 
-            .source-card {
-                background: var(--bg-secondary);
-                border: 1px solid var(--border-color);
-                border-radius: 8px;
-                padding: 0.75rem 1rem;
+        function createCandidateRow(item) {
+            const row = document.createElement('tr');
+            row.className = 'candidate-row';
+            const codeCell = row.insertCell();
+            const code = document.createElement('code');
+            code.textContent = item.code;
+            if (item.url) {
+                const link = document.createElement('a');
+                link.href = item.url;
+                link.target = '_blank';
+                link.rel = 'noopener';
+                link.appendChild(code);
+                codeCell.appendChild(link);
+            } else {
+                codeCell.appendChild(code);
+            }
+            // Confidence never changes for a code, and its label and class
+            // arrive pre-formatted from the server.
+            const badge = document.createElement('span');
+            badge.className = `confidence ${item.confidence_class}`;
+            badge.textContent = item.confidence_pct;
+            row.insertCell().appendChild(badge);
+            // Title, example text and timestamp are clamped so the row keeps
+            // its fixed height.
+            for (let i = 0; i < 3; i++) {
+                const text = document.createElement('div');
+                text.className = 'cell-text';
+                row.insertCell().appendChild(text);
             }
+            return row;
+        }
 
-            .source-card h3 {
-                margin: 0 0 0.5rem;
-                font-size: 1rem;
+        function updateCandidateRow(row, item, previous) {
+            const cells = row.cells;
+            setText(cells[2].firstChild, item.source_title || 'Unknown source');
+            // example_text is escaped server-side and carries <mark> highlights.
+            if (!previous || previous.example_text !== item.example_text) {
+                cells[3].firstChild.innerHTML = item.example_text || '';
             }
+            setText(cells[4].firstChild, item.discovered_at || '');
+        }
 
-            .source-card p {
-                margin: 0.25rem 0;
-                font-size: 0.85rem;
-                color: var(--text-secondary);
+        // Only the rows inside the scroll viewport (plus an overscan margin)
+        // are materialized; spacer rows stand in for the rest so the
+        // scrollbar keeps the geometry of the full list.
+        function renderCandidateWindow() {
+            candidateWindowPending = false;
+            const total = candidateItems.length;
+            if (!total) {
+                candidateRows = new Map();
+                candidatesBody.replaceChildren(emptyRow('No candidates found yet.'));
+                return;
             }
 
-            .source-card ul {
-                margin: 0.5rem 0 0;
-                padding-left: 1.25rem;
-                color: var(--text-secondary);
-                font-size: 0.8rem;
+            const visibleCount = Math.ceil(candidatesViewport.clientHeight / CANDIDATE_ROW_HEIGHT);
+            const startIdx = Math.max(0, Math.floor(candidatesViewport.scrollTop / CANDIDATE_ROW_HEIGHT) - CANDIDATE_OVERSCAN);
+            const endIdx = Math.min(total, startIdx + visibleCount + 2 * CANDIDATE_OVERSCAN);
+
+            const rows = new Map();
+            for (let i = startIdx; i < endIdx; i++) {
+                const item = candidateItems[i];
+                const cached = candidateRows.get(item.code);
+                const row = cached ? cached.row : createCandidateRow(item);
+                updateCandidateRow(row, item, cached && cached.item);
+                rows.set(item.code, { row, item });
             }
+            candidateRows = rows;
 
-            .badge {
-                display: inline-block;
-                padding: 0.2rem 0.5rem;
-                border-radius: 999px;
-                font-size: 0.75rem;
-                font-weight: 600;
-                background: var(--hover-bg);
-                color: var(--text-secondary);
+            topSpacer.style.height = `${startIdx * CANDIDATE_ROW_HEIGHT}px`;
+            bottomSpacer.style.height = `${(total - endIdx) * CANDIDATE_ROW_HEIGHT}px`;
+            // Rows dropped from the window are detached here; kept rows are
+            // moved into place rather than rebuilt.
+            candidatesBody.replaceChildren(topSpacer, ...Array.from(rows.values(), entry => entry.row), bottomSpacer);
+        }
+
+        function scheduleCandidateWindow() {
+            if (!candidateWindowPending) {
+                candidateWindowPending = true;
+                requestAnimationFrame(renderCandidateWindow);
             }
+        }
 
-            @media (max-width: 768px) {
-                body { padding: 1rem; }
-                h1 { font-size: 1.5rem; }
-                table, th, td { font-size: 0.85rem; }
-                .controls { flex-direction: column; align-items: stretch; }
-                button { width: 100%; }
+        function renderCandidates(candidates) {
+            candidateItems = candidates;
+            renderCandidateWindow();
+        }
+
+        function createLogItem([timestamp, level, message]) {
+            const item = document.createElement('li');
+            item.className = `log-${level}`;
+            const timestampEl = document.createElement('span');
+            timestampEl.className = 'log-timestamp';
+            timestampEl.textContent = timestamp;
+            item.append(timestampEl, message);
+            return item;
+        }
+
+        function renderLog(entries) {
+            if (!entries.length) {
+                logItems = new Map();
+                const empty = document.createElement('li');
+                empty.className = 'empty';
+                empty.textContent = 'No activity recorded yet.';
+                logEl.replaceChildren(empty);
+                return;
             }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <h1>🎬 Sora Invite Code Hunter</h1>
-            <p>Real-time monitoring of potential Sora invite codes from Reddit, X, Bluesky, Mastodon, Hacker News, and the OpenAI forums.</p>
-
-            <div class="controls">
-                <button id="refreshButton" type="button">🔄 Refresh now</button>
-                <label>
-                    <input type="checkbox" id="autoRefresh" checked />
-                    Auto refresh every minute
-                </label>
-                <span id="status">Waiting for first update…</span>
-            </div>
 
-            <div class="stats">
-                <div class="stat-card">
-                    <div class="stat-label">Total Candidates</div>
-                    <div class="stat-value" id="totalCandidates">0</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-label">Unique Codes Seen</div>
-                    <div class="stat-value" id="uniqueCodes">0</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-label">Successful Polls</div>
-                    <div class="stat-value" id="successCount">0</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-label">Errors</div>
-                    <div class="stat-value" id="errorCount">0</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-label">Active Sources</div>
-                    <div class="stat-value" id="activeSources">0</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-label">Paused/Disabled Sources</div>
-                    <div class="stat-value" id="pausedSources">0</div>
-                </div>
-            </div>
+            // Identical entries (same second, level and message) are told
+            // apart by their occurrence count.
+            const items = new Map();
+            const occurrences = new Map();
+            for (const entry of entries) {
+                const [timestamp, level, message] = entry;
+                const base = `${timestamp}|${level}|${message}`;
+                const count = occurrences.get(base) || 0;
+                occurrences.set(base, count + 1);
+                const key = `${base}#${count}`;
+                items.set(key, logItems.get(key) || createLogItem(entry));
+            }
+            logItems = items;
+            logEl.replaceChildren(...items.values());
+        }
 
-            <p><strong>Last Poll:</strong> <span id="lastPoll">not yet</span></p>
-            <p><strong>Tracking Query:</strong> <code id="queryDisplay"></code></p>
-            <p><strong>Environment Disabled Sources:</strong> <span id="disabledSourcesLabel">none</span></p>
-
-            <table>
-                <thead>
-                    <tr>
-                        <th>Code</th>
-                        <th>Confidence</th>
-                        <th>Source</th>
-                        <th>Example Text</th>
-                        <th>Discovered</th>
-                    </tr>
-                </thead>
-                <tbody id="candidatesBody">
-                    <tr><td colspan="5" class="empty">Loading candidates…</td></tr>
-                </tbody>
-            </table>
-
-            <h2>Source Status</h2>
-            <div id="sources" class="sources"></div>
-
-            <h2>Activity Log</h2>
-            <ul id="activityLog">
-                <li class="empty">Waiting for log entries…</li>
-            </ul>
-        </div>
-        <script>
-            const candidatesBody = document.getElementById('candidatesBody');
-            const lastPollEl = document.getElementById('lastPoll');
-            const statusEl = document.getElementById('status');
-            const logEl = document.getElementById('activityLog');
-            const refreshButton = document.getElementById('refreshButton');
-            const autoRefreshEl = document.getElementById('autoRefresh');
-            const totalCandidatesEl = document.getElementById('totalCandidates');
-            const uniqueCodesEl = document.getElementById('uniqueCodes');
-            const successCountEl = document.getElementById('successCount');
-            const errorCountEl = document.getElementById('errorCount');
-            const activeSourcesEl = document.getElementById('activeSources');
-            const pausedSourcesEl = document.getElementById('pausedSources');
-            const queryDisplayEl = document.getElementById('queryDisplay');
-            const disabledSourcesLabel = document.getElementById('disabledSourcesLabel');
-            const sourcesEl = document.getElementById('sources');
-
-            let refreshTimer = null;
-
-            function setStatus(text, isError = false) {
-                statusEl.textContent = text;
-                statusEl.style.color = isError ? 'var(--error-color)' : 'var(--text-secondary)';
+        function makeElement(tag, className, text) {
+            const node = document.createElement(tag);
+            if (className) {
+                node.className = className;
+            }
+            if (text !== undefined) {
+                node.textContent = text;
             }
+            return node;
+        }
 
-            function escapeHtml(value) {
-                return String(value ?? '')
-                    .replace(/&/g, '&amp;')
-                    .replace(/</g, '&lt;')
-                    .replace(/>/g, '&gt;')
-                    .replace(/"/g, '&quot;')
-                    .replace(/'/g, '&#039;');
+        function renderSources(sources) {
+            if (!sources.length) {
+                sourcesEl.replaceChildren(makeElement('p', 'empty', 'No sources configured.'));
+                return;
             }
 
-            function formatDate(value, fallback = '—') {
-                if (!value) {
-                    return fallback;
+            const frag = document.createDocumentFragment();
+            for (const source of sources) {
+                const lastSuccess = source.last_success
+                    ? formatDate(source.last_success, 'never')
+                    : 'never';
+                const lastError = source.last_error
+                    ? formatDate(source.last_error)
+                    : '—';
+                const status = source.active ? 'Active' : (source.enabled ? 'Paused' : 'Disabled');
+                const details = [];
+
+                if (source.disabled_reason === 'disabled-by-env') {
+                    details.push('Disabled via environment configuration');
+                } else if (source.disabled_reason === 'cooldown') {
+                    if (source.cooldown_until) {
+                        details.push(`Cooling down until ${formatDate(source.cooldown_until)}`);
+                    } else {
+                        details.push('Cooling down after repeated errors');
+                    }
+                } else if (source.disabled_reason === 'error') {
+                    details.push('Retrying after a transient error');
                 }
-                const date = new Date(value);
-                if (Number.isNaN(date.getTime())) {
-                    return String(value);
+
+                if (source.failure_count) {
+                    details.push(`Consecutive failures: ${source.failure_count}/${source.failure_threshold}`);
                 }
-                return date.toLocaleString();
-            }
 
-            function confidenceClass(score) {
-                if (score >= 0.75) {
-                    return 'confidence confidence-high';
+                if (source.rate_limit_delay) {
+                    details.push(`Rate limit delay: ${source.rate_limit_delay}s between requests`);
                 }
-                if (score >= 0.5) {
-                    return 'confidence confidence-medium';
+
+                const card = makeElement('div', 'source-card');
+                const statusLine = makeElement('p', null, 'Status: ');
+                statusLine.appendChild(makeElement('span', 'badge', status));
+                card.append(
+                    makeElement('h3', null, source.name),
+                    statusLine,
+                    makeElement('p', null, `Last success: ${lastSuccess}`),
+                    makeElement('p', null, `Last error: ${lastError}`),
+                );
+                if (details.length) {
+                    const detailList = document.createElement('ul');
+                    for (const detail of details) {
+                        detailList.appendChild(makeElement('li', null, detail));
+                    }
+                    card.appendChild(detailList);
                 }
-                return 'confidence confidence-low';
+                frag.appendChild(card);
             }
+            sourcesEl.replaceChildren(frag);
+        }
 
-            function renderCandidates(candidates) {
-                if (!candidates.length) {
-                    candidatesBody.innerHTML = '<tr><td colspan="5" class="empty">No candidates found yet.</td></tr>';
+        async function fetchData(manual = false) {
+            // A newer refresh supersedes any request still in flight.
+            if (inflight) {
+                inflight.abort();
+            }
+            const controller = new AbortController();
+            inflight = controller;
+            try {
+                setStatus(manual ? 'Refreshing…' : 'Updating…');
+                const headers = lastEtag ? { 'If-None-Match': lastEtag } : {};
+                const response = await fetch('/codes.json', { cache: 'no-store', headers, signal: controller.signal });
+                if (response.status === 304) {
+                    consecutiveErrors = 0;
+                    setStatus(manual ? 'Refreshed (no changes)' : `Last updated at ${new Date().toLocaleTimeString()}`);
                     return;
                 }
-
-                const rows = candidates.map(item => `
-                    <tr>
-                        <td>
-                            ${item.url ? `<a href="${encodeURI(item.url)}" target="_blank" rel="noopener"><code>${escapeHtml(item.code)}</code></a>` : `<code>${escapeHtml(item.code)}</code>`}
-                        </td>
-                        <td><span class="${confidenceClass(item.confidence_score)}">${(item.confidence_score * 100).toFixed(0)}%</span></td>
-                        <td>${escapeHtml(item.source_title || 'Unknown source')}</td>
-                        <td>${item.example_text || ''}</td>
-                        <td>${escapeHtml(item.discovered_at || '')}</td>
-                    </tr>
-                `).join('');
-                candidatesBody.innerHTML = rows;
-            }
-
-            function renderLog(entries) {
-                if (!entries.length) {
-                    logEl.innerHTML = '<li class="empty">No activity recorded yet.</li>';
+                if (!response.ok) {
+                    throw new Error(`Request failed with status ${response.status}`);
+                }
+                const data = await response.json();
+                lastEtag = response.headers.get('ETag');
+                lastPollEl.textContent = data.last_poll || 'not yet';
+                totalCandidatesEl.textContent = data.total_candidates ?? data.candidates.length;
+                uniqueCodesEl.textContent = data.unique_codes ?? data.candidates.length;
+                successCountEl.textContent = data.success_count ?? 0;
+                errorCountEl.textContent = data.error_count ?? 0;
+                const sources = data.sources || [];
+                const activeCount = sources.filter(source => source.active).length;
+                activeSourcesEl.textContent = activeCount;
+                pausedSourcesEl.textContent = Math.max(0, sources.length - activeCount);
+                queryDisplayEl.textContent = data.query || '';
+                const disabledList = data.disabled_sources || [];
+                disabledSourcesLabel.textContent = disabledList.length ? disabledList.join(', ') : 'none';
+
+                renderCandidates(data.candidates || []);
+                renderLog(data.activity_log || []);
+                renderSources(sources);
+
+                consecutiveErrors = 0;
+                setStatus(manual ? 'Refreshed' : `Last updated at ${new Date().toLocaleTimeString()}`);
+            } catch (err) {
+                if (err.name === 'AbortError') {
                     return;
                 }
+                consecutiveErrors += 1;
+                console.error(err);
+                setStatus(`Error updating: ${err.message}`, true);
+            } finally {
+                if (inflight === controller) {
+                    inflight = null;
+                }
+            }
+        }
 
-                const items = entries.map(entry => {
-                    const levelClass = `log-${entry.level}`;
-                    return `<li class="${levelClass}"><span class="log-timestamp">${escapeHtml(entry.timestamp)}</span>${escapeHtml(entry.message)}</li>`;
-                }).join('');
-                logEl.innerHTML = items;
+        // Polling pauses while the tab is hidden and backs off exponentially
+        // (up to 10 minutes) while requests keep failing.
+        function scheduleRefresh() {
+            if (refreshTimer) {
+                clearTimeout(refreshTimer);
+                refreshTimer = null;
+            }
+            if (!autoRefreshEl.checked || document.hidden) {
+                return;
             }
+            const delay = Math.min(REFRESH_INTERVAL_MS * 2 ** consecutiveErrors, MAX_REFRESH_INTERVAL_MS);
+            refreshTimer = setTimeout(refreshAndReschedule, delay);
+        }
 
-            function renderSources(sources) {
-                if (!sources.length) {
-                    sourcesEl.innerHTML = '<p class="empty">No sources configured.</p>';
-                    return;
+        async function refreshAndReschedule() {
+            refreshTimer = null;
+            await fetchData();
+            scheduleRefresh();
+        }
+
+        function handleVisibilityChange() {
+            if (document.hidden) {
+                scheduleRefresh();
+            } else if (autoRefreshEl.checked) {
+                if (refreshTimer) {
+                    clearTimeout(refreshTimer);
                 }
+                refreshAndReschedule();
+            }
+        }
 
-                const cards = sources.map(source => {
-                    const lastSuccess = source.last_success
-                        ? escapeHtml(formatDate(source.last_success, 'never'))
-                        : 'never';
-                    const lastError = source.last_error
-                        ? escapeHtml(formatDate(source.last_error))
-                        : '—';
-                    const status = source.active ? 'Active' : (source.enabled ? 'Paused' : 'Disabled');
-                    const details = [];
-
-                    if (source.disabled_reason === 'disabled-by-env') {
-                        details.push('Disabled via environment configuration');
-                    } else if (source.disabled_reason === 'cooldown') {
-                        if (source.cooldown_until) {
-                            details.push(`Cooling down until ${formatDate(source.cooldown_until)}`);
-                        } else {
-                            details.push('Cooling down after repeated errors');
-                        }
-                    } else if (source.disabled_reason === 'error') {
-                        details.push('Retrying after a transient error');
-                    }
+        refreshButton.addEventListener('click', () => fetchData(true));
+        document.addEventListener('visibilitychange', handleVisibilityChange);
+        candidatesViewport.addEventListener('scroll', scheduleCandidateWindow, { passive: true });
+        window.addEventListener('resize', scheduleCandidateWindow);
+        autoRefreshEl.addEventListener('change', scheduleRefresh);
 
-                    if (source.failure_count) {
-                        details.push(`Consecutive failures: ${source.failure_count}/${source.failure_threshold}`);
-                    }
+        fetchData().then(scheduleRefresh);
+    </script>
+</body>
+</html>
+"""
 
-                    if (source.rate_limit_delay) {
-                        details.push(`Rate limit delay: ${source.rate_limit_delay}s between requests`);
-                    }
 
-                    const detailList = details.length
-                        ? `<ul>${details.map(item => `<li>${escapeHtml(item)}</li>`).join('')}</ul>`
-                        : '';
-
-                    return `
-                        <div class="source-card">
-                            <h3>${escapeHtml(source.name)}</h3>
-                            <p>Status: <span class="badge">${escapeHtml(status)}</span></p>
-                            <p>Last success: ${lastSuccess}</p>
-                            <p>Last error: ${lastError}</p>
-                            ${detailList}
-                        </div>
-                    `;
-                }).join('');
-                sourcesEl.innerHTML = cards;
-            }
+def _render_dashboard() -> tuple[bytes, bytes, str]:
+    """Render the dashboard once and return its HTML, gzipped HTML and ETag.
 
-            async function fetchData(manual = false) {
-                try {
-                    setStatus(manual ? 'Refreshing…' : 'Updating…');
-                    const response = await fetch('/codes.json', { cache: 'no-store' });
-                    if (!response.ok) {
-                        throw new Error(`Request failed with status ${response.status}`);
-                    }
-                    const data = await response.json();
-                    lastPollEl.textContent = data.last_poll || 'not yet';
-                    totalCandidatesEl.textContent = data.total_candidates ?? data.candidates.length;
-                    uniqueCodesEl.textContent = data.unique_codes ?? data.candidates.length;
-                    successCountEl.textContent = data.success_count ?? 0;
-                    errorCountEl.textContent = data.error_count ?? 0;
-                    const sources = data.sources || [];
-                    const activeCount = sources.filter(source => source.active).length;
-                    activeSourcesEl.textContent = activeCount;
-                    pausedSourcesEl.textContent = Math.max(0, sources.length - activeCount);
-                    queryDisplayEl.textContent = data.query || '';
-                    const disabledList = data.disabled_sources || [];
-                    disabledSourcesLabel.textContent = disabledList.length ? disabledList.join(', ') : 'none';
-
-                    renderCandidates(data.candidates || []);
-                    renderLog(data.activity_log || []);
-                    renderSources(sources);
-
-                    setStatus(manual ? 'Refreshed' : `Last updated at ${new Date().toLocaleTimeString()}`);
-                } catch (err) {
-                    console.error(err);
-                    setStatus(`Error updating: ${err.message}`, true);
-                }
-            }
+    The page has no server-side data (it loads everything from /codes.json),
+    so the rendered output never changes while the process runs. Indentation
+    and blank lines are stripped; the template has no whitespace-sensitive
+    content (no ``<pre>`` blocks or multi-line JS strings).
+    """
 
-            function scheduleRefresh() {
-                if (refreshTimer) {
-                    clearInterval(refreshTimer);
-                    refreshTimer = null;
-                }
-                if (autoRefreshEl.checked) {
-                    refreshTimer = setInterval(fetchData, 60000);
-                }
-            }
+    with app.app_context():
+        rendered = render_template_string(DASHBOARD_TEMPLATE)
+    minified = "\n".join(line.strip() for line in rendered.splitlines() if line.strip())
+    body = minified.encode("utf-8")
+    etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+    return body, gzip.compress(body, compresslevel=9), etag
 
-            refreshButton.addEventListener('click', () => fetchData(true));
-            autoRefreshEl.addEventListener('change', scheduleRefresh);
 
-            fetchData();
-            scheduleRefresh();
-        </script>
-    </body>
-    </html>
-    """
-    return render_template_string(html_template)
+_DASHBOARD_HTML, _DASHBOARD_GZIP, _DASHBOARD_ETAG = _render_dashboard()
+
+
+def _accepts_gzip() -> bool:
+    """Return whether the current request allows a gzip-encoded response."""
+
+    return request.accept_encodings["gzip"] > 0
+
+
+@app.route("/")
+def index() -> Response:
+    """Serve the main web interface."""
+
+    if _accepts_gzip():
+        response = Response(_DASHBOARD_GZIP, mimetype="text/html")
+        response.headers["Content-Encoding"] = "gzip"
+        response.set_etag(f"{_DASHBOARD_ETAG}-gzip")
+    else:
+        response = Response(_DASHBOARD_HTML, mimetype="text/html")
+        response.set_etag(_DASHBOARD_ETAG)
+    response.headers["Cache-Control"] = "no-cache"
+    response.vary.add("Accept-Encoding")
+    return response.make_conditional(request)
 
 
 @app.route("/codes.json")
 def codes_json():
-    """Provide JSON snapshot of the current state."""
+    """Provide JSON snapshot of the current state.
+
+    The body is pre-serialized by the poller (see :func:`_publish_snapshot`).
+    Responses carry an ETag derived from the state version and the snapshot's
+    publish time as ``Last-Modified``; a client that sends either back
+    (``If-None-Match`` takes precedence) gets an empty ``304`` until the next
+    snapshot is published. Last-Modified only has one-second resolution, so
+    ``If-Modified-Since`` is a weak validator: no ``304`` for a date shared
+    with an earlier snapshot or not after the process start. Clients that
+    accept gzip get the body compressed once at publish time, under its own
+    ETag.
+    """
 
-    config = _get_config()
-    disabled_set = {name.lower() for name in config.get("disabled_sources", ())}
-    with state.lock:
-        candidates = [asdict(candidate) for candidate in reversed(state.candidates)]
-        activity_log = list(reversed(state.activity_log))
-        snapshot = {
-            "query": config["query"],
-            "poll_interval_seconds": config["poll_interval"],
-            "max_posts": config["max_posts"],
-            "disabled_sources": list(config.get("disabled_sources", ())),
-            "last_poll": state.last_poll,
-            "total_candidates": len(state.candidates),
-            "unique_codes": len(state.seen_codes),
-            "success_count": state.success_count,
-            "error_count": state.error_count,
-            "candidates": candidates,
-            "activity_log": activity_log,
-            "sources": [
-                {
-                    "name": source.name,
-                    "enabled": source.enabled,
-                    "active": (
-                        source.enabled
-                        and source.cooldown_until is None
-                        and source.name.lower() not in disabled_set
-                    ),
-                    "last_success": source.last_success,
-                    "last_error": source.last_error,
-                    "failure_count": source.failure_count,
-                    "failure_threshold": source.failure_threshold,
-                    "cooldown_until": _iso_from_timestamp(source.cooldown_until),
-                    "disabled_reason": source.disabled_reason,
-                    "rate_limit_delay": source.rate_limit_delay,
-                }
-                for source in SOURCES
-            ],
-        }
-    return jsonify(snapshot)
+    snapshot = state.snapshot or _publish_snapshot()
+    use_gzip = _accepts_gzip()
+    etag = f"{snapshot.etag}-gzip" if use_gzip else snapshot.etag
+    if request.if_none_match:
+        not_modified = request.if_none_match.contains(etag)
+    else:
+        since = request.if_modified_since
+        not_modified = (
+            since is not None
+            and since > _STATE_STARTED
+            and since >= snapshot.not_modified_since
+        )
+    if not_modified:
+        response = Response(status=304)
+    elif use_gzip:
+        response = Response(snapshot.body_gzip, mimetype="application/json")
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        response = Response(snapshot.body, mimetype="application/json")
+    response.set_etag(etag)
+    response.last_modified = snapshot.last_modified
+    response.headers["Cache-Control"] = "no-cache"
+    response.vary.add("Accept-Encoding")
+    return response
 
 
 @app.route("/healthz")
@@ -1316,34 +2017,39 @@ def healthz():
     """Simple health check endpoint for Render."""
 
     config = _get_config()
-    disabled_set = {name.lower() for name in config.get("disabled_sources", ())}
+    disabled_set = set(config.disabled_sources)
 
     with state.lock:
         thread_alive = bool(state.worker_thread and state.worker_thread.is_alive())
-        active_sources = [
-            source.name
-            for source in SOURCES
-            if source.enabled
-            and source.cooldown_until is None
-            and source.name.lower() not in disabled_set
-        ]
-        paused_sources = [
-            source.name
-            for source in SOURCES
-            if source.name.lower() in disabled_set
-            or not source.enabled
-            or source.cooldown_until is not None
-        ]
-
-        payload = {
-            "status": "ok" if thread_alive else "degraded",
-            "worker_thread_alive": thread_alive,
-            "active_sources": active_sources,
-            "paused_sources": paused_sources,
-            "total_candidates": len(state.candidates),
-            "last_poll": state.last_poll,
-            "error_count": state.error_count,
-        }
+        total_candidates = len(state.candidates)
+    with state.stats_lock:
+        last_poll = state.last_poll
+        error_count = state.error_count
+
+    active_sources = [
+        source.name
+        for source in SOURCES
+        if source.enabled
+        and source.cooldown_until is None
+        and source.name.lower() not in disabled_set
+    ]
+    paused_sources = [
+        source.name
+        for source in SOURCES
+        if source.name.lower() in disabled_set
+        or not source.enabled
+        or source.cooldown_until is not None
+    ]
+
+    payload = {
+        "status": "ok" if thread_alive else "degraded",
+        "worker_thread_alive": thread_alive,
+        "active_sources": active_sources,
+        "paused_sources": paused_sources,
+        "total_candidates": total_candidates,
+        "last_poll": last_poll,
+        "error_count": error_count,
+    }
 
     status_code = 200 if thread_alive else 503
     return jsonify(payload), status_code